@@ -9,6 +9,7 @@ import aiohttp
 import asyncio
 import re
 import os
+import sys
 import json
 import requests
 
@@ -33,7 +34,6 @@ Dlogger = Dlogger()
 class ErrorCatcher(discord.Client):
 
     async def on_error(event, *args, **kwargs):
-        import sys
         sys.exc_info()
 
         import pdb;pdb.set_trace()
@@ -47,6 +47,8 @@ class Discord(object):
 
     client = client  # so that network specific commands can access lower levels
 
+    RE_TAGS = re.compile(r'<[^>]*?>')
+
     async def connect(self):
 
         self.client = client
@@ -95,7 +97,7 @@ class Discord(object):
 
         posts = feedparser.parse('http://www.fmylife.com/rss')
         post = choice(posts.entries)
-        post = re.sub(r'<[^>]*?>', '', post.description).replace('FML', '')
+        post = self.RE_TAGS.sub('', post.description).replace('FML', '')
 
         await self.say(channel, str(post))
 
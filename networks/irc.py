@@ -48,6 +48,7 @@ class IRC(object):
         self._stream.write((out + '\r\n').encode('utf-8'))  # python3 required
 
     RE_ORIGIN = re.compile(r'([^!]*)!?([^@]*)@?(.*)')
+    RE_TAGS = re.compile(r'<[^>]*?>')
 
     def _on_read(self, data):
         data = data.decode('utf-8')
@@ -122,6 +123,6 @@ class IRC(object):
 
         posts = feedparser.parse('http://feeds2.feedburner.com/fmylife')
         post = choice(posts.entries)
-        post = re.sub(r'<[^>]*?>', '', post.description).replace('FML', '')
+        post = self.RE_TAGS.sub('', post.description).replace('FML', '')
 
         self.say(channel, str(post))
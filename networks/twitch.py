@@ -96,25 +96,15 @@ class TwitchParser(object):
         channel = parts[2] if len(parts) > 2 else ''
         body = parts[3] if len(parts) > 3 else ''
 
-        # this is gross
-        if event == 'PART':
-            self.on_part(user, channel, body)
-        elif event == 'JOIN':
-            self.on_join(user, channel, body)
-
-        elif event == 'PRIVMSG':
-            # either a new sub or a resub; we've already filtered out chat messages 
-            # logging.warning(msg)
-            self.on_sub(user, channel, body)
-
-        elif event == 'CLEARCHAT':
-            self.on_timeout(user, channel, body, meta)
+        handler = self.events.get(event)
+        if handler:
+            handler(self, user, channel, body, meta)
 
         else:
             # logging.warning('[{}] <{}:{}> {}'.format(event, channel, user, body))
             pass
 
-    def on_part(self, user, channel, body):
+    def on_part(self, user, channel, body, meta):
 
         e = Event(
             network="twitch",
@@ -126,7 +116,7 @@ class TwitchParser(object):
 
         e.save()
 
-    def on_join(self, user, channel, body):
+    def on_join(self, user, channel, body, meta):
 
         e = Event(
             network="twitch",
@@ -138,7 +128,7 @@ class TwitchParser(object):
 
         e.save()
 
-    def on_sub(self, user, channel, body):
+    def on_sub(self, user, channel, body, meta):
 
         # message is sent as user 'twitchnotify', pull this out of the body
         user = body[1:].split(' ')[0]
@@ -185,6 +175,14 @@ class TwitchParser(object):
 
             logging.warning('{} PERMABANNED'.format(user))
 
+    # map IRC events to their handlers, see on_event()
+    events = {
+        'PART': on_part,
+        'JOIN': on_join,
+        'PRIVMSG': on_sub,  # either a new sub or a resub; we've already filtered out chat messages
+        'CLEARCHAT': on_timeout,
+    }
+
 
 class TwitchAPI(object):
 
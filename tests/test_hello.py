@@ -1,15 +1,19 @@
-import tornado
-import tornado.testing
-from tornado.testing import AsyncTestCase
-from tornado.httpclient import AsyncHTTPClient
+import tornado.web
+from tornado.testing import AsyncHTTPTestCase
 
 
-# This test uses argument passing between self.stop and self.wait.
-class MyTestCase2(AsyncTestCase):
+class HelloHandler(tornado.web.RequestHandler):
+    def get(self):
+        self.write("Hello, FriendFeed")
+
+
+# serves a tiny app in-process, so the test doesn't depend on the network
+class MyTestCase2(AsyncHTTPTestCase):
+    def get_app(self):
+        return tornado.web.Application([(r"/", HelloHandler)])
+
     def test_http_fetch(self):
-        client = AsyncHTTPClient(self.io_loop)
-        client.fetch("http://www.tornadoweb.org/", self.stop)
-        response = self.wait()
+        response = self.fetch("/")
         # Test contents of response
+        assert response.code == 200
         assert "FriendFeed".encode('utf-8') in response.body
-
@@ -1,13 +1,14 @@
 import logging
 import uuid
+from collections import deque
 
 import tornado
 import tornado.websocket
 
 class ChatSocketHandler(tornado.websocket.WebSocketHandler):
     waiters = set()
-    cache = []
     cache_size = 500
+    cache = deque(maxlen=cache_size)  # oldest messages fall off the front
 
     # disabled - TODO config nginx properly
     def check_origin(self, origin):
@@ -26,8 +27,6 @@ class ChatSocketHandler(tornado.websocket.WebSocketHandler):
     @classmethod
     def update_cache(cls, chat):
         cls.cache.append(chat)
-        if len(cls.cache) > cls.cache_size:
-            cls.cache = cls.cache[-cls.cache_size:]
 
     @classmethod
     def send_updates(cls, chat):
@@ -55,4 +54,4 @@ class ChatSocketHandler(tornado.websocket.WebSocketHandler):
 import json
 class WebHandler(tornado.web.RequestHandler):
     def get(self):
-        self.render("webchat.html", messages=json.dumps(ChatSocketHandler.cache))
+        self.render("webchat.html", messages=json.dumps(list(ChatSocketHandler.cache)))